@@ -1,9 +1,15 @@
 from __future__ import annotations
 
+import atexit
+import contextlib
+import hashlib
+import json
 import time
 import typing
 
 if typing.TYPE_CHECKING:
+    import concurrent.futures
+
     from typing_extensions import Literal
 
     import polars as pl
@@ -14,10 +20,70 @@ from . import spec
 from . import trackers
 
 
+_MISSING = object()
+
+
+def _hash_job_datas(job_datas: typing.Iterable[typing.Any]) -> list[str]:
+    # md5 of the sorted json encoding, matching hashes stored by earlier
+    # versions, with the encoder and hash function resolved only once
+    dumps = json.JSONEncoder(sort_keys=True).encode
+    md5 = hashlib.md5
+    return [
+        md5(dumps(job_data).encode()).hexdigest() for job_data in job_datas
+    ]
+
+
+def _format_job_name(
+    prefix: str,
+    job_data: spec.JobData,
+    parameters: typing.Mapping[str, str] | None = None,
+) -> str:
+    if isinstance(job_data, (str, int, bool)):
+        return prefix + str(job_data)
+
+    elif isinstance(job_data, dict):
+        # validate and format each value in a single sorted pass
+        tokens = []
+        for key in sorted(job_data):
+            value = job_data[key]
+            if not isinstance(value, (str, int, bool)):
+                raise NotImplementedError(
+                    'must define job_name() for this type of job_data'
+                )
+            tokens.append(f'{key}_{value}')
+
+        # add additional parameters to name
+        if parameters is not None:
+            for key in sorted(parameters):
+                tokens.append(f'{key}_{parameters[key]}')
+
+        return prefix + '__'.join(tokens)
+
+    else:
+        raise NotImplementedError(
+            'must define get_job_name() for this type of job_data'
+        )
+
+
 class Batch:
     name: str | None = None
     jobs: typing.Sequence[spec.JobData] | None = None
 
+    # incremented whenever public batch state is reassigned or caches cleared
+    _generation: int = 0
+
+    # nonzero while an executor defers tracker flushes until it finishes
+    _flush_depth: int = 0
+
+    # process pool shared across orchestrate_jobs() calls while the batch
+    # that its workers were initialized with is unchanged
+    _pool: typing.ClassVar[
+        concurrent.futures.ProcessPoolExecutor | None
+    ] = None
+    _pool_n_processes: typing.ClassVar[int | None] = None
+    _pool_batch: typing.ClassVar[Batch | None] = None
+    _pool_generation: typing.ClassVar[int | None] = None
+
     #
     # # manadatory implementations
     #
@@ -43,6 +109,8 @@ class Batch:
         styles: toolcli.StyleTheme | None = None,
         verbose: bool = False,
     ) -> None:
+        self._name_cache: dict[int, str] = {}
+        self._hash_cache: dict[int, str] = {}
         self.name = name
         self.jobs = jobs
         if styles is None:
@@ -59,6 +127,30 @@ class Batch:
             batch=self,
         )
 
+    def __getstate__(self) -> dict[str, typing.Any]:
+        # caches are rebuilt on demand rather than shipped to workers
+        state = self.__dict__.copy()
+        state['_name_cache'] = {}
+        state['_hash_cache'] = {}
+        return state
+
+    def __setattr__(self, name: str, value: typing.Any) -> None:
+        # names, hashes, and paths are cached per index of the current jobs
+        super().__setattr__(name, value)
+        if name in ('jobs', 'name'):
+            self.clear_caches()
+        elif not name.startswith('_'):
+            self._generation += 1
+
+    def clear_caches(self) -> None:
+        # call directly after modifying jobs in place
+        self._generation += 1
+        self._name_cache = {}
+        self._hash_cache = {}
+        tracker = self.__dict__.get('tracker')
+        if tracker is not None:
+            tracker.clear_caches()
+
     #
     # # names
     #
@@ -79,33 +171,47 @@ class Batch:
         if job_data is None:
             if i is None:
                 raise Exception('must specify job_data or i')
+            if parameters is None:
+                job_name = self._name_cache.get(i)
+                if job_name is None:
+                    job_name = self.get_job_name(job_data=self.get_job_data(i))
+                    self._name_cache[i] = job_name
+                return job_name
             job_data = self.get_job_data(i)
 
-        if isinstance(job_data, (str, int, bool)):
-            return self.get_job_list_name() + str(job_data)
-
-        elif isinstance(job_data, dict):
-            for key, value in job_data.items():
-                if not isinstance(value, (str, int, bool)):
-                    raise NotImplementedError(
-                        'must define job_name() for this type of job_data'
-                    )
-            tokens = [
-                key + '_' + job_data[key]
-                for key, value in sorted(job_data.items())
-            ]
-
-            # add additional parameters to name
-            if parameters is not None:
-                for key, value in sorted(parameters.items()):
-                    tokens.append(key + '_' + value)
+        return _format_job_name(
+            self.get_job_list_name(), job_data, parameters
+        )
 
-            return self.get_job_list_name() + '__'.join(tokens)
+    def get_job_names(
+        self,
+        indices: typing.Sequence[int] | None = None,
+        *,
+        parameters: typing.Mapping[str, str] | None = None,
+    ) -> list[str]:
+        if indices is None:
+            indices = range(self.get_n_jobs())
+
+        # respect subclasses that customize get_job_name()
+        if type(self).get_job_name is not Batch.get_job_name:
+            if parameters is None:
+                return [self.get_job_name(i=i) for i in indices]
+            return [
+                self.get_job_name(i=i, parameters=parameters) for i in indices
+            ]
 
-        else:
-            raise NotImplementedError(
-                'must define get_job_name() for this type of job_data'
-            )
+        # otherwise format names in bulk, resolving the prefix only once
+        prefix = self.get_job_list_name()
+        if parameters is not None:
+            return [
+                _format_job_name(prefix, self.get_job_data(i), parameters)
+                for i in indices
+            ]
+        cache = self._name_cache
+        for i in indices:
+            if i not in cache:
+                cache[i] = _format_job_name(prefix, self.get_job_data(i))
+        return [cache[i] for i in indices]
 
     def parse_job_name(self, name: str) -> spec.JobData:
         job_data = {}
@@ -116,13 +222,14 @@ class Batch:
 
     @staticmethod
     def _parse_name_token(token: str) -> bool | int | str:
-        try:
-            return bool(token)
-        except Exception:
-            try:
-                return int(token)
-            except Exception:
-                return token
+        if token == 'True':
+            return True
+        elif token == 'False':
+            return False
+        elif (token[1:] if token.startswith('-') else token).isdecimal():
+            return int(token)
+        else:
+            return token
 
     #
     # # job data
@@ -149,17 +256,12 @@ class Batch:
     #
 
     def get_remaining_jobs(self) -> typing.Sequence[int]:
-        jobs = range(self.get_n_jobs())
-        return [
-            j
-            for j, complete in enumerate(self.are_jobs_complete(jobs))
-            if not complete
-        ]
+        return self.tracker.get_remaining_jobs()
 
     def are_jobs_complete(
         self, indices: typing.Sequence[int]
     ) -> typing.Sequence[bool]:
-        return [self.tracker.is_job_complete(i) for i in indices]
+        return self.tracker.are_jobs_complete(indices)
 
     #
     # # hashes
@@ -168,16 +270,15 @@ class Batch:
     def get_job_hash(
         self, i: int | None = None, *, job_data: spec.JobData | None = None
     ) -> str:
-        import hashlib
-        import json
-
         if job_data is None:
             if i is None:
                 raise Exception('must specify i or job_hash')
-            job_data = self.get_job_data(i)
-        job_data_str = json.dumps(job_data, sort_keys=True)
-        job_hash = hashlib.md5(job_data_str.encode()).hexdigest()
-        return job_hash
+            job_hash = self._hash_cache.get(i)
+            if job_hash is None:
+                job_hash = self.get_job_hash(job_data=self.get_job_data(i))
+                self._hash_cache[i] = job_hash
+            return job_hash
+        return _hash_job_datas([job_data])[0]
 
     def get_job_hashes(
         self,
@@ -185,11 +286,29 @@ class Batch:
         *,
         job_datas: typing.Sequence[typing.Any] | None = None,
     ) -> typing.Sequence[str]:
-        if job_datas is None:
+        # respect subclasses that customize get_job_hash()
+        if type(self).get_job_hash is not Batch.get_job_hash:
+            if job_datas is not None:
+                return [
+                    self.get_job_hash(job_data=job_data)
+                    for job_data in job_datas
+                ]
             if indices is None:
-                indices = list(range(self.get_n_jobs()))
-            job_datas = [self.get_job_data(i) for i in indices]
-        return [self.get_job_hash(job_data) for job_data in job_datas]
+                indices = range(self.get_n_jobs())
+            return [self.get_job_hash(i=i) for i in indices]
+
+        if job_datas is not None:
+            return _hash_job_datas(job_datas)
+
+        if indices is None:
+            indices = range(self.get_n_jobs())
+        missing = [i for i in indices if i not in self._hash_cache]
+        if len(missing) > 0:
+            missing_hashes = _hash_job_datas(
+                self.get_job_data(i) for i in missing
+            )
+            self._hash_cache.update(zip(missing, missing_hashes))
+        return [self._hash_cache[i] for i in indices]
 
     #
     # # execution
@@ -197,15 +316,22 @@ class Batch:
 
     def orchestrate_jobs(
         self,
-        executor: Literal['serial', 'parallel'] = 'parallel',
+        executor: Literal[
+            'serial', 'parallel', 'processes', 'threads', 'async'
+        ] = 'parallel',
         n_processes: int | None = None,
     ) -> None:
         import tooltime
 
-        self.print_status()
+        # status checks share one completion snapshot from the tracker
+        self.tracker.begin_orchestration()
+        try:
+            remaining_jobs = self.get_remaining_jobs()
+            self.print_status(remaining_jobs=remaining_jobs)
+        finally:
+            self.tracker.end_orchestration()
 
         # check whether to circuit break
-        remaining_jobs = self.get_remaining_jobs()
         if len(remaining_jobs) == 0:
             print('\nAll jobs already completed')
             return
@@ -224,8 +350,12 @@ class Batch:
         # execute jobs
         if executor == 'serial':
             self.serial_execute(jobs=remaining_jobs)
-        elif executor == 'parallel':
+        elif executor in ('parallel', 'processes'):
             self.parallel_execute(jobs=remaining_jobs, n_processes=n_processes)
+        elif executor == 'threads':
+            self.thread_execute(jobs=remaining_jobs, n_threads=n_processes)
+        elif executor == 'async':
+            self.async_execute(jobs=remaining_jobs, n_concurrent=n_processes)
         else:
             raise Exception('unknown executor: ' + str(executor))
 
@@ -240,24 +370,139 @@ class Batch:
         import tqdm
 
         color = self._get_progress_bar_color()
-        for job in tqdm.tqdm(jobs, colour=color):
-            self.run_job(job)
+        with self._deferred_flush():
+            for job in tqdm.tqdm(jobs, colour=color):
+                self.run_job(job)
 
     def parallel_execute(
         self,
         jobs: typing.Sequence[int],
         n_processes: int | None = None,
+        chunksize: int | None = None,
     ) -> None:
         import concurrent.futures
+        import os
         import tqdm
 
+        if n_processes is None:
+            n_processes = os.cpu_count() or 1
+        if chunksize is None:
+            chunksize = max(1, len(jobs) // (n_processes * 4))
+
+        # workers receive the batch once at startup, so each task only sends
+        # a chunk of indices, and pending futures are bounded so completed
+        # ones are freed
         color = self._get_progress_bar_color()
-        with concurrent.futures.ProcessPoolExecutor(n_processes) as executor:
-            futures = [executor.submit(self.run_job, i=job) for job in jobs]
+        executor = self._get_pool(n_processes)
+        pending: set[concurrent.futures.Future[int]] = set()
+        try:
             with tqdm.tqdm(total=len(jobs), colour=color) as pbar:
-                for future in concurrent.futures.as_completed(futures):
+                for start in range(0, len(jobs), chunksize):
+                    chunk = jobs[start : start + chunksize]
+                    pending.add(executor.submit(_run_jobs_worker, chunk))
+                    if len(pending) >= 2 * n_processes:
+                        pending = self._drain_futures(pending, pbar)
+                while len(pending) > 0:
+                    pending = self._drain_futures(pending, pbar)
+        except BaseException:
+            # do not leave queued or running chunks behind in the shared pool
+            for future in pending:
+                future.cancel()
+            self.shutdown_pool()
+            raise
+
+    @staticmethod
+    def _drain_futures(
+        pending: set[concurrent.futures.Future[int]],
+        pbar: typing.Any,
+    ) -> set[concurrent.futures.Future[int]]:
+        import concurrent.futures
+
+        # wait for at least one future, releasing finished ones immediately
+        done, not_done = concurrent.futures.wait(
+            pending, return_when=concurrent.futures.FIRST_COMPLETED
+        )
+        for future in done:
+            pbar.update(future.result())
+        return not_done
+
+    def thread_execute(
+        self,
+        jobs: typing.Sequence[int],
+        n_threads: int | None = None,
+    ) -> None:
+        import concurrent.futures
+        import tqdm
+
+        color = self._get_progress_bar_color()
+        with self._deferred_flush():
+            with concurrent.futures.ThreadPoolExecutor(n_threads) as executor:
+                results = executor.map(self.run_job, jobs)
+                for _ in tqdm.tqdm(results, total=len(jobs), colour=color):
+                    pass
+
+    def async_execute(
+        self,
+        jobs: typing.Sequence[int],
+        n_concurrent: int | None = None,
+    ) -> None:
+        import asyncio
+        import os
+        import tqdm
+
+        if n_concurrent is None:
+            n_concurrent = min(32, (os.cpu_count() or 1) + 4)
+
+        color = self._get_progress_bar_color()
+        with tqdm.tqdm(total=len(jobs), colour=color) as pbar:
+            remaining = iter(jobs)
+
+            # each worker pulls the next job until none remain
+            async def worker() -> None:
+                for i in remaining:
+                    await self.run_job_async(i)
                     pbar.update(1)
 
+            async def run_workers() -> None:
+                await asyncio.gather(*(worker() for _ in range(n_concurrent)))
+
+            with self._deferred_flush():
+                asyncio.run(run_workers())
+
+    def _get_pool(
+        self, n_processes: int | None = None
+    ) -> concurrent.futures.ProcessPoolExecutor:
+        import concurrent.futures
+
+        # workers hold a snapshot of the batch, so any change to the batch
+        # since the pool was started requires new workers
+        if (
+            Batch._pool is None
+            or getattr(Batch._pool, '_broken', False)
+            or Batch._pool_n_processes != n_processes
+            or Batch._pool_batch is not self
+            or Batch._pool_generation != self._generation
+        ):
+            self.shutdown_pool()
+            Batch._pool = concurrent.futures.ProcessPoolExecutor(
+                n_processes,
+                initializer=_init_worker,
+                initargs=(self,),
+            )
+            Batch._pool_n_processes = n_processes
+            Batch._pool_batch = self
+            Batch._pool_generation = self._generation
+        return Batch._pool
+
+    @classmethod
+    def shutdown_pool(cls) -> None:
+        if Batch._pool is not None:
+            Batch._pool.shutdown()
+            Batch._pool = None
+            Batch._pool_n_processes = None
+            Batch._pool_batch = None
+            Batch._pool_generation = None
+
     def _get_progress_bar_color(self) -> str | None:
         if self.styles is None:
             return None
@@ -265,15 +510,60 @@ class Batch:
             return self.styles.get('content')
 
     def run_job(self, i: int) -> None:
+        import inspect
+
         self.start_job(i=i)
-        self.execute_job(i=i)
-        self.end_job(i=i)
+        try:
+            if inspect.iscoroutinefunction(self.execute_job):
+                import asyncio
+
+                asyncio.run(self.execute_job(i=i))
+            else:
+                self.execute_job(i=i)
+            self.end_job(i=i)
+        finally:
+            if self._flush_depth == 0:
+                self.tracker.flush()
+
+    async def run_job_async(self, i: int) -> None:
+        import asyncio
+        import inspect
+
+        if inspect.iscoroutinefunction(self.execute_job):
+            self.start_job(i=i)
+            try:
+                await self.execute_job(i=i)
+                self.end_job(i=i)
+            finally:
+                if self._flush_depth == 0:
+                    self.tracker.flush()
+        else:
+            # blocking jobs run in the event loop's default thread pool
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, self.run_job, i)
+
+    def run_jobs(self, indices: typing.Sequence[int]) -> int:
+        with self._deferred_flush():
+            for i in indices:
+                self.run_job(i=i)
+        return len(indices)
+
+    @contextlib.contextmanager
+    def _deferred_flush(self) -> typing.Iterator[None]:
+        # jobs run within this block leave tracker writes buffered, and
+        # the buffer is flushed once when the block exits
+        self._flush_depth += 1
+        try:
+            yield
+        finally:
+            self._flush_depth -= 1
+            self.tracker.flush()
 
     def start_job(self, i: int) -> None:
-        pass
+        self.tracker.start_job(i=i)
 
     def end_job(self, i: int) -> None:
-        pass
+        self.tracker.end_job(i=i)
 
     #
     # # times
@@ -282,12 +572,12 @@ class Batch:
     def get_job_start_time(
         self, i: int | None = None, *, job_data: typing.Any | None = None
     ) -> int | float | None:
-        raise NotImplementedError()
+        return self.tracker.get_job_start_time(i=i, job_data=job_data)
 
     def get_job_end_time(
         self, i: int | None = None, *, job_data: typing.Any | None = None
     ) -> int | float | None:
-        raise NotImplementedError()
+        return self.tracker.get_job_end_time(i=i, job_data=job_data)
 
     def get_jobs_start_times(
         self,
@@ -295,15 +585,7 @@ class Batch:
         *,
         job_datas: typing.Sequence[typing.Any] | None = None,
     ) -> typing.Sequence[int | float | None]:
-        if indices is not None:
-            return [self.get_job_start_time(i=i) for i in indices]
-        elif job_datas is not None:
-            return [
-                self.get_job_start_time(job_data=job_data)
-                for job_data in job_datas
-            ]
-        else:
-            raise Exception('must specify indices or job_datas')
+        return self.tracker.get_jobs_start_times(indices, job_datas=job_datas)
 
     def get_jobs_end_times(
         self,
@@ -311,15 +593,7 @@ class Batch:
         *,
         job_datas: typing.Sequence[typing.Any] | None = None,
     ) -> typing.Sequence[int | float | None]:
-        if indices is not None:
-            return [self.get_job_end_time(i=i) for i in indices]
-        elif job_datas is not None:
-            return [
-                self.get_job_end_time(job_data=job_data)
-                for job_data in job_datas
-            ]
-        else:
-            raise Exception('must specify indices or job_datas')
+        return self.tracker.get_jobs_end_times(indices, job_datas=job_datas)
 
     #
     # # summary
@@ -351,25 +625,30 @@ class Batch:
         toolstr.print_bullet(key=key, value=value, styles=self.styles, **kwargs)
 
     def get_attribute_list(self) -> typing.Sequence[str]:
-        attributes = list(vars(self).keys())
         if self.jobs is None:
-            del attributes[attributes.index('jobs')]
-        return attributes
+            return [key for key in vars(self) if key != 'jobs']
+        else:
+            return list(vars(self))
 
     def get_formatted_attribute(self, key: str) -> str | None:
         return str(getattr(self, key))
 
-    def print_status(self) -> None:
+    def print_status(
+        self, remaining_jobs: typing.Sequence[int] | None = None
+    ) -> None:
         import types
         import toolstr
 
+        if remaining_jobs is None:
+            remaining_jobs = self.get_remaining_jobs()
+
         self.print_text_box('Collecting dataset ' + self.get_job_list_name())
         print()
         self.print_header('Parameters')
         self.print_bullet(key='n_jobs', value=self.get_n_jobs())
         toolstr.print_bullet(
             key='n_jobs_remaining',
-            value=len(self.get_remaining_jobs()),
+            value=len(remaining_jobs),
         )
 
         for obj, skip_keys in [
@@ -377,10 +656,9 @@ class Batch:
             (self.tracker, ['batch']),
         ]:
             for parameter in obj.get_attribute_list():  # type: ignore
-                if hasattr(obj, parameter):
-                    value = getattr(obj, parameter)
-                else:
-                    value = None
+                value = getattr(obj, parameter, _MISSING)
+                if value is _MISSING:
+                    continue
                 if (
                     not parameter.startswith('_')
                     and not isinstance(value, types.MethodType)
@@ -410,7 +688,8 @@ class Batch:
             bullet_str='',
         )
 
-        done_jobs = len([self.tracker.is_job_complete(i) for i in jobs])
+        # execution raises on any failed job, so every job in jobs completed
+        done_jobs = len(jobs)
         print()
         print(done_jobs, 'jobs completed')
         print()
@@ -421,6 +700,7 @@ class Batch:
         seconds_per_job = duration / done_jobs
         jobs_per_second = done_jobs / duration
         jobs_per_minute = jobs_per_second * 60
+        jobs_per_hour = jobs_per_second * 3600
         jobs_per_day = jobs_per_second * 86400
         self.print_bullet(
             'duration',
@@ -435,7 +715,7 @@ class Batch:
         )
         self.print_bullet(
             'jobs per hour',
-            toolstr.format(jobs_per_second * 86400 / 24, decimals=2),
+            toolstr.format(jobs_per_hour, decimals=2),
         )
         self.print_bullet(
             'jobs per day', toolstr.format(jobs_per_day, decimals=2),
@@ -455,26 +735,59 @@ class Batch:
     def summarize_jobs_per_second(self, sample_time: int = 60) -> pl.DataFrame:
         import polars as pl
 
-        names = [self.get_job_name(i) for i in range(self.get_n_jobs())]
-        times = [self.get_job_end_time(i) for i in range(self.get_n_jobs())]
-        df = pl.from_dict({'job': names, 'times': times})
-        df = df.with_columns(
-            (pl.col('times') / sample_time).cast(int).alias('sample')
-        )
-        df = df.with_columns(
-            [
-                pl.col('job'),
-                pl.count().over('sample').alias('jobs_per_second')
-                / sample_time,
-            ]
+        indices = range(self.get_n_jobs())
+        names = [self.get_job_name(i) for i in indices]
+        times = self.get_jobs_end_times(indices)
+        return (
+            pl.LazyFrame({'job': names, 'times': times})
+            .with_columns(
+                (pl.col('times') // sample_time).cast(int).alias('sample')
+            )
+            .with_columns(
+                (pl.count().over('sample') / sample_time).alias(
+                    'jobs_per_second'
+                )
+            )
+            .select(['job', 'jobs_per_second'])
+            .collect()
         )
-        return df[['job', 'jobs_per_second']]
 
     def summarize_total_time(self) -> float | None:
-        raw_times = self.get_jobs_end_times(list(range(self.get_n_jobs())))
-        times = [float(time) for time in raw_times if time is not None]
-        if len(times) > 0:
-            return max(times) - min(times)
+        # single pass over end times without materializing them
+        min_time = float('inf')
+        max_time = float('-inf')
+        any_times = False
+        for raw_time in self.tracker.iter_jobs_end_times():
+            if raw_time is None:
+                continue
+            end_time = float(raw_time)
+            if end_time < min_time:
+                min_time = end_time
+            if end_time > max_time:
+                max_time = end_time
+            any_times = True
+        if any_times:
+            return max_time - min_time
         else:
             return None
 
+
+atexit.register(Batch.shutdown_pool)
+
+
+#
+# # worker processes
+#
+
+_WORKER_BATCH: Batch | None = None
+
+
+def _init_worker(batch: Batch) -> None:
+    global _WORKER_BATCH
+    _WORKER_BATCH = batch
+
+
+def _run_jobs_worker(indices: typing.Sequence[int]) -> int:
+    if _WORKER_BATCH is None:
+        raise Exception('worker process has not been initialized with a batch')
+    return _WORKER_BATCH.run_jobs(indices)
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import os
+import time
 import typing
 
 from .. import spec
@@ -12,6 +13,9 @@ class FileTracker(tracker.Tracker):
     output_dir: str
     output_filetype: str
 
+    # seconds for which a directory listing is reused between calls
+    listing_ttl: float = 0.05
+
     def __init__(
         self,
         output_dir: str,
@@ -20,42 +24,151 @@ class FileTracker(tracker.Tracker):
     ) -> None:
         self.output_dir = os.path.abspath(os.path.expanduser(output_dir))
         self.output_filetype = output_filetype
-        if not os.path.isdir(output_dir):
+        self._ext = '.' + output_filetype
+        self._prefix = os.path.join(self.output_dir, '')
+        self._path_cache: dict[int, str] = {}
+        self._listing: frozenset[str] | None = None
+        self._listing_time = 0.0
+        self._listing_mtime = 0
+        self._completion_cache: dict[int, bool] | None = None
+        try:
+            os.makedirs(self.output_dir)
             print('output_dir does not exist, creating now')
-            os.makedirs(output_dir)
+        except FileExistsError:
+            if not os.path.isdir(self.output_dir):
+                raise
         super().__init__(**kwargs)
 
+    def __getstate__(self) -> dict[str, typing.Any]:
+        state = super().__getstate__()
+        state['_path_cache'] = {}
+        state['_listing'] = None
+        state['_listing_time'] = 0.0
+        state['_listing_mtime'] = 0
+        state['_completion_cache'] = None
+        return state
+
     #
     # # interface methods
     #
 
-    def get_remaining_jobs(self) -> typing.Sequence[int]:
-        return [
-            i
-            for i in range(self.batch.get_n_jobs())
-            if self.get_job_output_filename(i=i) in os.listdir(self.output_dir)
-        ]
+    def clear_caches(self) -> None:
+        self._path_cache = {}
+        self._completion_cache = None
+
+    def begin_orchestration(self) -> None:
+        # completion status is read from one listing until the window ends
+        self._completion_cache = None
+        completes = self.are_jobs_complete()
+        self._completion_cache = dict(enumerate(completes))
+
+    def end_orchestration(self) -> None:
+        self._completion_cache = None
+
+    def end_job(self, i: int) -> None:
+        if self._completion_cache is not None:
+            self._completion_cache[i] = True
 
     def is_job_complete(
         self, i: int | None = None, *, job_data: spec.JobData | None = None
     ) -> bool:
+        if self._completion_cache is not None and job_data is None:
+            if i in self._completion_cache:
+                return self._completion_cache[i]
         return os.path.exists(self.get_job_output_path(i=i, job_data=job_data))
 
+    def are_jobs_complete(
+        self,
+        indices: typing.Sequence[int] | None = None,
+        *,
+        job_datas: typing.Sequence[typing.Any] | None = None,
+    ) -> typing.Sequence[bool]:
+        if self._completion_cache is not None and job_datas is None:
+            cache = self._completion_cache
+            if indices is None:
+                indices = range(self.batch.get_n_jobs())
+            if all(i in cache for i in indices):
+                return [cache[i] for i in indices]
+
+        # list output_dir once instead of checking each path separately
+        listing = self._output_listing()
+        filenames = self.get_jobs_output_filenames(
+            indices, job_datas=job_datas
+        )
+        return [filename in listing for filename in filenames]
+
     #
     # # filesystem-specific methods
     #
 
+    def _output_listing(self) -> frozenset[str]:
+        # reuse a recent listing unless entries were added or removed since
+        now = time.monotonic()
+        mtime = os.stat(self.output_dir).st_mtime_ns
+        if (
+            self._listing is None
+            or now - self._listing_time > self.listing_ttl
+            or mtime != self._listing_mtime
+        ):
+            with os.scandir(self.output_dir) as entries:
+                self._listing = frozenset(
+                    entry.name for entry in entries if entry.is_file()
+                )
+            self._listing_time = now
+            self._listing_mtime = mtime
+        return self._listing
+
+    def _stat_map(self) -> dict[str, os.stat_result]:
+        with os.scandir(self.output_dir) as entries:
+            return {
+                entry.name: entry.stat()
+                for entry in entries
+                if entry.is_file()
+            }
+
     def get_job_output_filename(
         self, i: int | None = None, *, job_data: spec.JobData | None = None
     ) -> str:
-        job_name = self.batch.get_job_name(i=i, job_data=job_data)
-        return job_name + '.' + self.output_filetype
+        return self.batch.get_job_name(i=i, job_data=job_data) + self._ext
 
     def get_job_output_path(
         self, i: int | None = None, *, job_data: spec.JobData | None = None
     ) -> str:
-        filename = self.get_job_output_filename(i=i, job_data=job_data)
-        return os.path.join(self.output_dir, filename)
+        if job_data is None and i is not None:
+            path = self._path_cache.get(i)
+            if path is None:
+                path = self._prefix + self.get_job_output_filename(i=i)
+                self._path_cache[i] = path
+            return path
+        return self._prefix + self.get_job_output_filename(
+            i=i, job_data=job_data
+        )
+
+    def get_jobs_output_filenames(
+        self,
+        indices: typing.Sequence[int] | None = None,
+        *,
+        job_datas: typing.Sequence[typing.Any] | None = None,
+    ) -> list[str]:
+        if job_datas is not None:
+            return [
+                self.get_job_output_filename(job_data=job_data)
+                for job_data in job_datas
+            ]
+        ext = self._ext
+        return [name + ext for name in self.batch.get_job_names(indices)]
+
+    def get_jobs_output_paths(
+        self,
+        indices: typing.Sequence[int] | None = None,
+        *,
+        job_datas: typing.Sequence[typing.Any] | None = None,
+    ) -> list[str]:
+        prefix = self._prefix
+        filenames = self.get_jobs_output_filenames(
+            indices, job_datas=job_datas
+        )
+        return [prefix + filename for filename in filenames]
 
     def parse_job_output_path(self, path: str) -> typing.Any:
         job_name, ext = os.path.splitext(os.path.basename(path))
@@ -65,27 +178,69 @@ class FileTracker(tracker.Tracker):
     # # sumary methods
     #
 
-    def get_job_start_time(self, i: int) -> int | float | None:
-        path = self.get_job_output_path(i)
-        if os.path.isfile(path):
-            return os.path.getctime(path)
-        else:
+    def get_job_start_time(
+        self, i: int | None = None, *, job_data: spec.JobData | None = None
+    ) -> int | float | None:
+        path = self.get_job_output_path(i, job_data=job_data)
+        try:
+            return os.stat(path).st_ctime
+        except FileNotFoundError:
             return None
 
-    def get_job_end_time(self, i: int) -> int | float | None:
-        path = self.get_job_output_path(i)
-        if os.path.isfile(path):
-            return os.path.getmtime(path)
-        else:
+    def get_job_end_time(
+        self, i: int | None = None, *, job_data: spec.JobData | None = None
+    ) -> int | float | None:
+        path = self.get_job_output_path(i, job_data=job_data)
+        try:
+            return os.stat(path).st_mtime
+        except FileNotFoundError:
             return None
 
+    def get_jobs_start_times(
+        self,
+        indices: typing.Sequence[int] | None = None,
+        *,
+        job_datas: typing.Sequence[typing.Any] | None = None,
+    ) -> typing.Sequence[int | float | None]:
+        # stat output_dir in one pass instead of stat-ing each path
+        stats = self._stat_map()
+        filenames = self.get_jobs_output_filenames(
+            indices, job_datas=job_datas
+        )
+        return [
+            stats[filename].st_ctime if filename in stats else None
+            for filename in filenames
+        ]
+
+    def get_jobs_end_times(
+        self,
+        indices: typing.Sequence[int] | None = None,
+        *,
+        job_datas: typing.Sequence[typing.Any] | None = None,
+    ) -> typing.Sequence[int | float | None]:
+        stats = self._stat_map()
+        filenames = self.get_jobs_output_filenames(
+            indices, job_datas=job_datas
+        )
+        return [
+            stats[filename].st_mtime if filename in stats else None
+            for filename in filenames
+        ]
+
+    def iter_jobs_end_times(
+        self, indices: typing.Sequence[int] | None = None
+    ) -> typing.Iterator[int | float | None]:
+        # one scandir pass, yielding None for jobs without an output file
+        stats = self._stat_map()
+        for filename in self.get_jobs_output_filenames(indices):
+            stat = stats.get(filename)
+            yield stat.st_mtime if stat is not None else None
+
     def print_status(self) -> None:
         import toolstr
 
-        total_size = 0
-        for i in range(self.batch.get_n_jobs()):
-            path = self.get_job_output_path(i)
-            if os.path.isfile(path):
-                total_size = os.path.getsize(path)
+        with os.scandir(self.output_dir) as entries:
+            total_size = sum(
+                entry.stat().st_size for entry in entries if entry.is_file()
+            )
         print('- output_dir size:', toolstr.format_nbytes(total_size))
-
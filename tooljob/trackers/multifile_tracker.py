@@ -38,6 +38,42 @@ def _get_output_dict(
     }
 
 
+def _normalize_outputs(
+    outputs: spec.ShorthandOutputsSpec,
+    output_dir: str | None = None,
+    output_filetype: str | None = None,
+) -> spec.OutputsSpec:
+    # gather (name, shorthand spec) pairs from either outputs format
+    entries: list[tuple[str, typing.Mapping[str, str]]] = []
+    if isinstance(outputs, dict):
+        entries.extend(outputs.items())
+    elif isinstance(outputs, (list, tuple)):
+        for output in outputs:
+            if isinstance(output, str):
+                entries.append((output, {}))
+            elif isinstance(output, dict):
+                name = output.get('name')
+                if name is None:
+                    raise Exception('must specify "name" in each output')
+                entries.append((name, output))
+            else:
+                raise Exception('invalid format for output: ' + str(output))
+    else:
+        raise Exception('invalid format for outputs')
+
+    normalized = {}
+    for name, output in entries:
+        if output.get('name') is not None and output.get('name') != name:
+            raise Exception('names do not match in outputs spec')
+        normalized[name] = _get_output_dict(
+            output_dir=output.get('output_dir'),
+            output_filetype=output.get('output_filetype'),
+            default_output_dir=output_dir,
+            default_output_filetype=output_filetype,
+        )
+    return normalized
+
+
 class MultifileTracker(tracker.Tracker):
     """
 
@@ -54,50 +90,36 @@ class MultifileTracker(tracker.Tracker):
         **kwargs: typing.Any,
     ) -> None:
         # compile outputs specifications
-        strict_outputs: typing.MutableMapping[str, spec.OutputSpec] = {}
-        if isinstance(outputs, list):
-            for output in outputs:
-                if isinstance(output, str):
-                    strict_outputs[output] = _get_output_dict(
-                        default_output_dir=output_dir,
-                        default_output_filetype=output_filetype,
-                    )
-                elif isinstance(output, dict):
-                    name = output.get('name')
-                    if name is None:
-                        raise Exception('must specify "name" in each output')
-                    strict_outputs[name] = _get_output_dict(
-                        default_output_dir=output_dir,
-                        default_output_filetype=output_filetype,
-                        **output,
-                    )
-                else:
-                    raise Exception()
-        elif isinstance(outputs, dict):
-            for name, output in outputs.items():
-                if output.get('name') is not None and name != output.get(
-                    'name'
-                ):
-                    raise Exception('names do not match in outputs spec')
-                strict_outputs[name] = _get_output_dict(
-                    default_output_dir=output_dir,
-                    default_output_filetype=output_filetype,
-                    **output,
-                )
-        else:
-            raise Exception('invalid format for outputs')
-        self.outputs = strict_outputs
+        self.outputs = _normalize_outputs(outputs, output_dir, output_filetype)
+        self._outputs_seq = tuple(
+            (name, output['output_dir'], '.' + output['output_filetype'])
+            for name, output in self.outputs.items()
+        )
+        self._paths_cache: dict[int, typing.Mapping[str, str]] = {}
 
-        # create missing directories
-        for output in self.outputs.values():
-            output_output_dir = output['output_dir']
-            if not os.path.isdir(output_output_dir):
+        # create missing directories, once per distinct directory
+        output_dirs = {
+            output['output_dir'] for output in self.outputs.values()
+        }
+        for output_dir in sorted(output_dirs):
+            try:
+                os.makedirs(output_dir)
                 print('output_dir does not exist, creating now')
-                os.makedirs(output_output_dir)
+            except FileExistsError:
+                if not os.path.isdir(output_dir):
+                    raise
 
         # create base tracker
         super().__init__(**kwargs)
 
+    def __getstate__(self) -> dict[str, typing.Any]:
+        state = super().__getstate__()
+        state['_paths_cache'] = {}
+        return state
+
+    def clear_caches(self) -> None:
+        self._paths_cache = {}
+
     #
     # # interface methods
     #
@@ -112,6 +134,50 @@ class MultifileTracker(tracker.Tracker):
             ).values()
         )
 
+    def are_jobs_complete(
+        self,
+        indices: typing.Sequence[int] | None = None,
+        *,
+        job_datas: typing.Sequence[typing.Any] | None = None,
+    ) -> typing.Sequence[bool]:
+        if job_datas is not None:
+            n_jobs = len(job_datas)
+        else:
+            if indices is None:
+                indices = range(self.batch.get_n_jobs())
+            n_jobs = len(indices)
+
+        # list each distinct output directory once
+        listings: dict[str, frozenset[str]] = {}
+        for _, output_dir, _ in self._outputs_seq:
+            if output_dir not in listings:
+                with os.scandir(output_dir) as entries:
+                    listings[output_dir] = frozenset(
+                        entry.name for entry in entries if entry.is_file()
+                    )
+
+        # a job is complete only if every one of its outputs exists
+        completes = [True] * n_jobs
+        for output_name, output_dir, ext in self._outputs_seq:
+            parameters = {'output_name': output_name}
+            if job_datas is not None:
+                names = [
+                    self.batch.get_job_name(
+                        job_data=job_data, parameters=parameters
+                    )
+                    for job_data in job_datas
+                ]
+            else:
+                names = self.batch.get_job_names(
+                    indices, parameters=parameters
+                )
+            listing = listings[output_dir]
+            completes = [
+                complete and name + ext in listing
+                for complete, name in zip(completes, names)
+            ]
+        return completes
+
     #
     # # filesystem-specific methods
     #
@@ -120,26 +186,33 @@ class MultifileTracker(tracker.Tracker):
         self, i: int | None = None, *, job_data: spec.JobData | None = None
     ) -> typing.Mapping[str, str]:
         output_filenames = {}
-        for output_name, output in self.outputs.items():
+        for output_name, _, suffix in self._outputs_seq:
             job_name = self.batch.get_job_name(
                 i=i,
                 job_data=job_data,
                 parameters={'output_name': output_name},
             )
-            output_filenames[output_name] = (
-                job_name + '.' + output['output_filetype']
-            )
+            output_filenames[output_name] = job_name + suffix
         return output_filenames
 
     def get_job_output_paths(
         self, i: int | None = None, *, job_data: spec.JobData | None = None
+    ) -> typing.Mapping[str, str]:
+        if job_data is None and i is not None:
+            paths = self._paths_cache.get(i)
+            if paths is None:
+                paths = self._compute_job_output_paths(i=i)
+                self._paths_cache[i] = paths
+            return paths
+        return self._compute_job_output_paths(i=i, job_data=job_data)
+
+    def _compute_job_output_paths(
+        self, i: int | None = None, *, job_data: spec.JobData | None = None
     ) -> typing.Mapping[str, str]:
         filenames = self.get_job_output_filenames(i=i, job_data=job_data)
         return {
-            output_name: os.path.join(
-                self.outputs[output_name]['output_dir'], filename
-            )
-            for output_name, filename in filenames.items()
+            output_name: os.path.join(output_dir, filenames[output_name])
+            for output_name, output_dir, _ in self._outputs_seq
         }
 
     def parse_job_output_path(self, path: str) -> typing.Any:
@@ -150,32 +223,47 @@ class MultifileTracker(tracker.Tracker):
     # # sumary methods
     #
 
-    def get_job_start_time(self, i: int) -> int | float | None:
-        paths = self.get_job_output_paths(i)
-        times = [
-            os.path.getctime(path)
-            for path in paths.values()
-            if os.path.isfile(path)
-        ]
-        return min(times)
-
-    def get_job_end_time(self, i: int) -> int | float | None:
-        paths = self.get_job_output_paths(i)
-        times = [
-            os.path.getmtime(path)
-            for path in paths.values()
-            if os.path.isfile(path)
-        ]
-        return max(times)
+    def get_job_start_time(
+        self, i: int | None = None, *, job_data: spec.JobData | None = None
+    ) -> int | float | None:
+        stats = self._stat_job_outputs(i=i, job_data=job_data)
+        if len(stats) == 0:
+            return None
+        return min(stat.st_ctime for stat in stats)
+
+    def get_job_end_time(
+        self, i: int | None = None, *, job_data: spec.JobData | None = None
+    ) -> int | float | None:
+        stats = self._stat_job_outputs(i=i, job_data=job_data)
+        if len(stats) == 0:
+            return None
+        return max(stat.st_mtime for stat in stats)
+
+    def _stat_job_outputs(
+        self, i: int | None = None, *, job_data: spec.JobData | None = None
+    ) -> list[os.stat_result]:
+        # one stat per existing output instead of isfile() plus a time call
+        stats = []
+        for path in self.get_job_output_paths(i=i, job_data=job_data).values():
+            try:
+                stats.append(os.stat(path))
+            except FileNotFoundError:
+                pass
+        return stats
 
     def print_status(self) -> None:
         import toolstr
 
+        # scan each distinct output directory once
         total_size = 0
-        for i in range(self.batch.get_n_jobs()):
-            paths = self.get_job_output_paths(i)
-            for path in paths.values():
-                if os.path.isfile(path):
-                    total_size = os.path.getsize(path)
+        output_dirs = {
+            output['output_dir'] for output in self.outputs.values()
+        }
+        for output_dir in output_dirs:
+            with os.scandir(output_dir) as entries:
+                total_size += sum(
+                    entry.stat().st_size
+                    for entry in entries
+                    if entry.is_file()
+                )
         print('- output_dir size:', toolstr.format_nbytes(total_size))
-
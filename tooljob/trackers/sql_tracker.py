@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import os
+import threading
 import time
 import typing
 
@@ -13,12 +15,65 @@ class SqlTracker(tracker.Tracker):
 
     db_config: toolsql.DBConfig
 
+    # buffered job writes are flushed at this many rows or after this age
+    flush_size: int = 128
+    flush_interval: float = 0.1
+
+    # maximum number of job hashes bound into a single IN clause
+    query_chunk_size: int = 1000
+
     def __init__(
         self, db_config: toolsql.DBConfig, **kwargs: typing.Any
     ) -> None:
         self.db_config = db_config
+        self._end_time_cache: dict[str, int | float] = {}
+        self._connections: dict[tuple[int, int], typing.Any] = {}
+        self._pending_starts: list[dict[str, typing.Any]] = []
+        self._pending_ends: list[tuple[str, float]] = []
+        self._pending_since: float | None = None
+        self._write_lock = threading.Lock()
         super().__init__(**kwargs)
 
+    def __getstate__(self) -> dict[str, typing.Any]:
+        # caches, connections, and buffered writes stay in this process
+        state = super().__getstate__()
+        state['_end_time_cache'] = {}
+        state['_connections'] = {}
+        state['_pending_starts'] = []
+        state['_pending_ends'] = []
+        state['_pending_since'] = None
+        del state['_write_lock']
+        return state
+
+    def __setstate__(self, state: dict[str, typing.Any]) -> None:
+        self.__dict__.update(state)
+        self._write_lock = threading.Lock()
+
+    def get_remaining_jobs(self) -> typing.Sequence[int]:
+        import array
+
+        # hash every job once, then query only those not known complete
+        job_hashes = self.batch.get_job_hashes()
+        cache = self._end_time_cache
+        unknown = [
+            job_hash for job_hash in job_hashes if job_hash not in cache
+        ]
+        done = set(cache)
+        if len(unknown) > 0:
+            end_times = self._select_by_hash(unknown, 'end_time')
+            for job_hash, end_time in end_times.items():
+                if end_time is not None:
+                    cache[job_hash] = end_time
+                    done.add(job_hash)
+        return array.array(
+            'i',
+            (
+                i
+                for i, job_hash in enumerate(job_hashes)
+                if job_hash not in done
+            ),
+        )
+
     def is_job_complete(
         self, i: int | None = None, *, job_data: spec.JobData | None = None
     ) -> bool:
@@ -37,6 +92,22 @@ class SqlTracker(tracker.Tracker):
     # # database-specific methods
     #
 
+    def _get_conn(self) -> typing.Any:
+        # reuse one read connection per process and thread
+        key = (os.getpid(), threading.get_ident())
+        conn = self._connections.get(key)
+        if conn is None:
+            conn = toolsql.connect(self.db_config)
+            self._connections[key] = conn
+        return conn
+
+    def close(self) -> None:
+        pid = os.getpid()
+        for key, conn in list(self._connections.items()):
+            if key[0] == pid:
+                conn.close()
+                del self._connections[key]
+
     @classmethod
     def get_db_schema(cls) -> toolsql.DBSchema:
         raw_schema: toolsql.TableSchemaShorthand = {
@@ -57,28 +128,73 @@ class SqlTracker(tracker.Tracker):
             for table in db_schema['tables'].values():
                 toolsql.create_table(table=table, conn=conn)
 
-    def start_job(self, i: int) -> None:
+    def start_job(self, i: int, sync: bool = False) -> None:
         job_data = self.batch.get_job_data(i)
-        job_hash = self.batch.get_job_hash(job_data=job_data)
+        job_hash = self.batch.get_job_hash(i=i)
         row = {
             'job_data': job_data,
             'job_hash': job_hash,
             'start_time': time.time(),
             'end_time': None,
         }
-        with toolsql.connect(self.db_config) as conn:
-            toolsql.insert(table='jobs', row=row, conn=conn)
+        with self._write_lock:
+            self._pending_starts.append(row)
+        self._flush_if_due(sync)
 
-    def end_job(self, i: int) -> None:
-        job_data = self.batch.get_job_data(i)
-        job_hash = self.batch.get_job_hash(job_data=job_data)
-        with toolsql.connect(self.db_config) as conn:
-            toolsql.update(
-                table='jobs',
-                values={'end_time': time.time()},
-                where_equals={'job_hash': job_hash},
-                conn=conn,
+    def end_job(self, i: int, sync: bool = False) -> None:
+        job_hash = self.batch.get_job_hash(i=i)
+        with self._write_lock:
+            self._pending_ends.append((job_hash, time.time()))
+        self._flush_if_due(sync)
+
+    def _flush_if_due(self, force: bool = False) -> None:
+        now = time.monotonic()
+        with self._write_lock:
+            if self._pending_since is None:
+                self._pending_since = now
+            n_pending = len(self._pending_starts) + len(self._pending_ends)
+            due = (
+                force
+                or n_pending >= self.flush_size
+                or now - self._pending_since >= self.flush_interval
             )
+        if due:
+            self.flush()
+
+    def flush(self) -> None:
+        with self._write_lock:
+            starts = self._pending_starts
+            ends = self._pending_ends
+            if len(starts) == 0 and len(ends) == 0:
+                self._pending_since = None
+                return
+
+            # rerunning an unfinished job replaces its previous start row
+            rows = list({row['job_hash']: row for row in starts}.values())
+
+            # insert before updating so that end times find their rows
+            with toolsql.connect(self.db_config) as conn:
+                if len(rows) > 0:
+                    toolsql.insert(
+                        table='jobs',
+                        rows=rows,
+                        conn=conn,
+                        on_conflict='update',
+                    )
+                for job_hash, end_time in ends:
+                    toolsql.update(
+                        table='jobs',
+                        values={'end_time': end_time},
+                        where_equals={'job_hash': job_hash},
+                        conn=conn,
+                    )
+
+            # drop buffered rows only once they have been written
+            self._pending_starts = []
+            self._pending_ends = []
+            self._pending_since = None
+            for job_hash, end_time in ends:
+                self._end_time_cache[job_hash] = end_time
 
     def delete_job_records(
         self,
@@ -89,9 +205,11 @@ class SqlTracker(tracker.Tracker):
         job_hashes = self.batch.get_job_hashes(
             indices=indices, job_datas=job_datas
         )
+        for job_hash in job_hashes:
+            self._end_time_cache.pop(job_hash, None)
         with toolsql.connect(self.db_config) as conn:
             toolsql.delete(
-                where_in={'job_hash': [job_hashes]}, table='jobs', conn=conn
+                where_in={'job_hash': job_hashes}, table='jobs', conn=conn
             )
 
     #
@@ -102,27 +220,30 @@ class SqlTracker(tracker.Tracker):
         self, i: int | None = None, *, job_data: spec.JobData | None = None
     ) -> int | float | None:
         job_hash = self.batch.get_job_hash(i=i, job_data=job_data)
-        with toolsql.connect(self.db_config) as conn:
-            return toolsql.select(
-                where_equals={'job_hash': job_hash},
-                table='jobs',
-                conn=conn,
-                columns=['start_time'],
-                output_format='cell_or_none',
-            )
+        return toolsql.select(
+            where_equals={'job_hash': job_hash},
+            table='jobs',
+            conn=self._get_conn(),
+            columns=['start_time'],
+            output_format='cell_or_none',
+        )
 
     def get_job_end_time(
         self, i: int | None = None, *, job_data: spec.JobData | None = None
     ) -> int | float | None:
         job_hash = self.batch.get_job_hash(i=i, job_data=job_data)
-        with toolsql.connect(self.db_config) as conn:
-            return toolsql.select(
-                where_equals={'job_hash': job_hash},
-                table='jobs',
-                conn=conn,
-                columns=['end_time'],
-                output_format='cell_or_none',
-            )
+        if job_hash in self._end_time_cache:
+            return self._end_time_cache[job_hash]
+        end_time: int | float | None = toolsql.select(
+            where_equals={'job_hash': job_hash},
+            table='jobs',
+            conn=self._get_conn(),
+            columns=['end_time'],
+            output_format='cell_or_none',
+        )
+        if end_time is not None:
+            self._end_time_cache[job_hash] = end_time
+        return end_time
 
     def get_jobs_start_times(
         self,
@@ -133,14 +254,8 @@ class SqlTracker(tracker.Tracker):
         job_hashes = self.batch.get_job_hashes(
             indices=indices, job_datas=job_datas
         )
-        with toolsql.connect(self.db_config) as conn:
-            return toolsql.select(
-                where_in={'job_hash': job_hashes},
-                table='jobs',
-                conn=conn,
-                columns=['start_time'],
-                output_format='single_column',
-            )
+        start_times = self._select_by_hash(job_hashes, 'start_time')
+        return [start_times.get(job_hash) for job_hash in job_hashes]
 
     def get_jobs_end_times(
         self,
@@ -151,12 +266,34 @@ class SqlTracker(tracker.Tracker):
         job_hashes = self.batch.get_job_hashes(
             indices=indices, job_datas=job_datas
         )
-        with toolsql.connect(self.db_config) as conn:
-            return toolsql.select(
-                where_in={'job_hash': job_hashes},
+
+        # only query jobs not already known to be complete
+        cache = self._end_time_cache
+        unknown = [
+            job_hash for job_hash in job_hashes if job_hash not in cache
+        ]
+        if len(unknown) > 0:
+            end_times = self._select_by_hash(unknown, 'end_time')
+            for job_hash, end_time in end_times.items():
+                if end_time is not None:
+                    cache[job_hash] = end_time
+        return [cache.get(job_hash) for job_hash in job_hashes]
+
+    def _select_by_hash(
+        self, job_hashes: typing.Sequence[str], column: str
+    ) -> typing.Mapping[str, typing.Any]:
+        # rows come back in arbitrary order, so key them by job_hash
+        conn = self._get_conn()
+        chunk_size = self.query_chunk_size
+        values = {}
+        for start in range(0, len(job_hashes), chunk_size):
+            rows = toolsql.select(
+                where_in={'job_hash': job_hashes[start:start + chunk_size]},
                 table='jobs',
                 conn=conn,
-                columns=['end_time'],
-                output_format='single_column',
+                columns=['job_hash', column],
+                output_format='dict',
             )
-
+            for row in rows:
+                values[row['job_hash']] = row[column]
+        return values
@@ -8,18 +8,116 @@ from .. import spec
 class Tracker:
     def __init__(self, batch: batch_class.Batch, **kwargs: typing.Any):
         self.batch = batch
+        self._formatted_attributes: dict[str, tuple[typing.Any, str]] = {}
+
+    def __getstate__(self) -> dict[str, typing.Any]:
+        # caches are rebuilt on demand rather than shipped to workers
+        state = self.__dict__.copy()
+        state['_formatted_attributes'] = {}
+        return state
+
+    def begin_orchestration(self) -> None:
+        pass
+
+    def end_orchestration(self) -> None:
+        pass
+
+    def start_job(self, i: int) -> None:
+        pass
+
+    def end_job(self, i: int) -> None:
+        pass
+
+    def flush(self) -> None:
+        pass
+
+    def clear_caches(self) -> None:
+        pass
 
     def get_remaining_jobs(self) -> typing.Sequence[int]:
-        raise NotImplementedError('get_remaining_jobs() not implemented')
+        import array
+
+        # store indices as C ints rather than boxed python ints
+        completes = self.are_jobs_complete()
+        return array.array(
+            'i', (i for i, complete in enumerate(completes) if not complete)
+        )
 
     def is_job_complete(
         self, i: int | None = None, *, job_data: spec.JobData | None = None
     ) -> bool:
         raise NotImplementedError('is_job_complete() not implemented')
 
+    def are_jobs_complete(
+        self,
+        indices: typing.Sequence[int] | None = None,
+        *,
+        job_datas: typing.Sequence[typing.Any] | None = None,
+    ) -> typing.Sequence[bool]:
+        if job_datas is not None:
+            return [
+                self.is_job_complete(job_data=job_data)
+                for job_data in job_datas
+            ]
+        if indices is None:
+            indices = range(self.batch.get_n_jobs())
+        return [self.is_job_complete(i=i) for i in indices]
+
+    def get_job_start_time(
+        self, i: int | None = None, *, job_data: spec.JobData | None = None
+    ) -> int | float | None:
+        raise NotImplementedError('get_job_start_time() not implemented')
+
+    def get_job_end_time(
+        self, i: int | None = None, *, job_data: spec.JobData | None = None
+    ) -> int | float | None:
+        raise NotImplementedError('get_job_end_time() not implemented')
+
+    def get_jobs_start_times(
+        self,
+        indices: typing.Sequence[int] | None = None,
+        *,
+        job_datas: typing.Sequence[typing.Any] | None = None,
+    ) -> typing.Sequence[int | float | None]:
+        if job_datas is not None:
+            return [
+                self.get_job_start_time(job_data=job_data)
+                for job_data in job_datas
+            ]
+        if indices is None:
+            indices = range(self.batch.get_n_jobs())
+        return [self.get_job_start_time(i=i) for i in indices]
+
+    def get_jobs_end_times(
+        self,
+        indices: typing.Sequence[int] | None = None,
+        *,
+        job_datas: typing.Sequence[typing.Any] | None = None,
+    ) -> typing.Sequence[int | float | None]:
+        if job_datas is not None:
+            return [
+                self.get_job_end_time(job_data=job_data)
+                for job_data in job_datas
+            ]
+        if indices is None:
+            indices = range(self.batch.get_n_jobs())
+        return [self.get_job_end_time(i=i) for i in indices]
+
+    def iter_jobs_end_times(
+        self, indices: typing.Sequence[int] | None = None
+    ) -> typing.Iterator[int | float | None]:
+        yield from self.get_jobs_end_times(indices)
+
     def get_attribute_list(self) -> typing.Sequence[str]:
         return list(vars(self).keys())
 
     def get_formatted_attribute(self, key: str) -> str | None:
-        return str(getattr(self, key))
+        # reformat only when the attribute has been rebound to a new object
+        value = getattr(self, key)
+        cached = self._formatted_attributes.get(key)
+        if cached is not None and cached[0] is value:
+            return cached[1]
+        formatted = str(value)
+        self._formatted_attributes[key] = (value, formatted)
+        return formatted
 
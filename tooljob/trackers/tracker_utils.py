@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import functools
+import importlib
 import typing
 
 if typing.TYPE_CHECKING:
@@ -10,6 +12,35 @@ if typing.TYPE_CHECKING:
     from . import tracker
 
 
+# tracker name -> (module, class, required parameters, optional parameters)
+_TRACKERS: typing.Mapping[
+    str, tuple[str, str, typing.Sequence[str], typing.Sequence[str]]
+] = {
+    'file': (
+        'file_tracker',
+        'FileTracker',
+        ['output_dir', 'output_filetype'],
+        [],
+    ),
+    'multifile': (
+        'multifile_tracker',
+        'MultifileTracker',
+        ['outputs'],
+        ['output_dir', 'output_filetype'],
+    ),
+    'sql': ('sql_tracker', 'SqlTracker', ['db_config'], []),
+    'bucket': ('bucket_tracker', 'BucketTracker', ['bucket_path'], []),
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _get_tracker_class(name: str) -> typing.Type[tracker.Tracker]:
+    module_name, class_name, _, _ = _TRACKERS[name]
+    module = importlib.import_module('.' + module_name, __package__)
+    tracker_class: typing.Type[tracker.Tracker] = getattr(module, class_name)
+    return tracker_class
+
+
 def create_tracker(
     tracker: str | None = None,
     *,
@@ -20,6 +51,9 @@ def create_tracker(
     bucket_path: str | None = None,
     batch: batch_class.Batch | None = None,
 ) -> tracker.Tracker:
+    if batch is None:
+        raise Exception('must specify batch for tracker')
+
     # determine tracker
     if tracker is None:
         if outputs is not None:
@@ -32,59 +66,26 @@ def create_tracker(
             tracker = 'bucket'
         else:
             raise Exception('invalid tracker: ' + str(tracker))
-
-    if tracker == 'file':
-        from . import file_tracker
-
-        assert (
-            output_dir is not None
-        ), 'must specify output_dir for file tracker'
-        assert (
-            output_filetype is not None
-        ), 'must specify output_dir for file tracker'
-
-        return file_tracker.FileTracker(
-            batch=batch,
-            output_dir=output_dir,
-            output_filetype=output_filetype,
-        )
-
-    elif tracker == 'multifile':
-        from . import multifile_tracker
-
-        assert outputs is not None, 'must specify outputs for MultifileTracker'
-
-        return multifile_tracker.MultifileTracker(
-            batch=batch,
-            outputs=outputs,
-            output_dir=output_dir,
-            output_filetype=output_filetype,
-        )
-
-    elif tracker == 'sql':
-        from . import sql_tracker
-
-        assert db_config is not None, 'must specify db_config for sql tracker'
-
-        return sql_tracker.SqlTracker(
-            batch=batch,
-            db_config=db_config,
-        )
-
-    elif tracker == 'bucket':
-        from . import bucket_tracker
-
-        raise NotImplementedError('bucket tracker')
-
-        assert (
-            bucket_path is not None
-        ), 'must specify bucket_path for bucket tracker'
-
-        return bucket_tracker.BucketTracker(
-            batch=batch,
-            bucket_path=bucket_path,
-        )
-
-    else:
-        raise Exception('no tracker specified')
-
+    if tracker not in _TRACKERS:
+        raise Exception('unknown tracker: ' + str(tracker))
+
+    # collect parameters used by tracker
+    parameters: typing.Mapping[str, typing.Any] = {
+        'output_dir': output_dir,
+        'output_filetype': output_filetype,
+        'outputs': outputs,
+        'db_config': db_config,
+        'bucket_path': bucket_path,
+    }
+    _, _, required, optional = _TRACKERS[tracker]
+    kwargs = {}
+    for key in required:
+        if parameters[key] is None:
+            raise Exception(
+                'must specify ' + key + ' for ' + tracker + ' tracker'
+            )
+        kwargs[key] = parameters[key]
+    for key in optional:
+        kwargs[key] = parameters[key]
+
+    return _get_tracker_class(tracker)(batch=batch, **kwargs)